@@ -2,7 +2,11 @@
 Tournament API – FastAPI backend.
 Uses Supabase (service role) for DB. Run: uvicorn main:app --reload --port 8000
 """
+import base64
+import json
 import os
+import uuid
+from datetime import datetime
 from typing import Any, Optional
 
 from dotenv import load_dotenv
@@ -277,7 +281,163 @@ def get_draws(
     return {"tournament_id": tournament_id, "event_filter": event, "standard_filter": standard, "age_group_filter": age_group, "events": events, "standards": standards, "age_groups": age_groups, "groups": groups, "matches": matches}
 
 
-# --- Admin-only: edit/delete registrations (player info) and matches (draws) ---
+# --- Admin-only: list/edit/delete registrations (player info) and matches (draws) ---
+
+REGISTRATION_COLUMNS = (
+    "id", "tournament_id", "full_name", "email", "phone", "age_group", "event",
+    "partner_name", "partner_id", "standard", "notes", "group_id", "created_at",
+)
+# Characters with meaning in PostgREST or=(...) filter syntax; stripped from search terms
+_SEARCH_STRIP = str.maketrans("", "", ',()*"')
+# Page size for the division-counts fallback (matches Supabase's default max-rows)
+_COUNTS_FALLBACK_PAGE = 1000
+
+
+def _like_escape(term: str) -> str:
+    """Escape LIKE wildcards so the search term matches literally (Postgres default escape is backslash)."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _encode_cursor(row: dict[str, Any]) -> str:
+    raw = json.dumps([row["created_at"], str(row["id"])]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, rid = json.loads(raw)
+        # Re-serialise the parsed timestamp so only a well-formed value reaches the filter
+        return datetime.fromisoformat(created_at).isoformat(), str(uuid.UUID(rid))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _filter_registrations(
+    q: Any,
+    tournament_id: Optional[str],
+    event: Optional[str],
+    standard: Optional[str],
+    age_group: Optional[str],
+    group_id: Optional[str],
+    search: Optional[str],
+) -> Any:
+    # Keyset pagination orders by created_at; rows without one could never be paged to (migration 006 backfills them)
+    q = q.not_.is_("created_at", "null")
+    if tournament_id:
+        q = q.eq("tournament_id", tournament_id)
+    if event:
+        q = q.eq("event", event)
+    if standard:
+        q = q.eq("standard", standard)
+    if age_group:
+        q = q.eq("age_group", age_group)
+    if group_id == "none":
+        q = q.is_("group_id", "null")
+    elif group_id:
+        q = q.eq("group_id", group_id)
+    if search:
+        q = q.or_(f"full_name.ilike.*{search}*,email.ilike.*{search}*")
+    return q
+
+
+def _registration_division_counts(
+    tournament_id: Optional[str],
+    event: Optional[str],
+    standard: Optional[str],
+    age_group: Optional[str],
+    group_id: Optional[str],
+    search: Optional[str],
+) -> list[dict[str, Any]]:
+    """Counts per tournament + event + standard + age_group; falls back to paging through division columns if migration 006 not run."""
+    unassigned = group_id == "none"
+    params = {
+        "p_tournament_id": tournament_id,
+        "p_event": event,
+        "p_standard": standard,
+        "p_age_group": age_group,
+        "p_group_id": None if unassigned else group_id,
+        "p_unassigned": unassigned,
+        "p_search": search,
+    }
+    try:
+        r = supabase.rpc("registration_division_counts", params).execute()
+        return [{**row, "count": int(row["count"])} for row in r.data or []]
+    except Exception as e:
+        err_str = str(e).lower()
+        if "pgrst202" not in err_str and "registration_division_counts" not in err_str and "does not exist" not in err_str:
+            raise
+    # Page through with range(): PostgREST caps a single response at max-rows (1000 on Supabase),
+    # so advance by however many rows came back until a page is empty.
+    counts: dict[tuple[Any, Any, Any, Any], int] = {}
+    start = 0
+    while True:
+        q = _filter_registrations(supabase.table("registrations").select("tournament_id, event, standard, age_group"), tournament_id, event, standard, age_group, group_id, search)
+        page = q.order("id").range(start, start + _COUNTS_FALLBACK_PAGE - 1).execute().data or []
+        if not page:
+            break
+        for row in page:
+            k = (row.get("tournament_id"), row.get("event"), row.get("standard"), row.get("age_group"))
+            counts[k] = counts.get(k, 0) + 1
+        start += len(page)
+    return [{"tournament_id": k[0], "event": k[1], "standard": k[2], "age_group": k[3], "count": n} for k, n in sorted(counts.items(), key=lambda kv: tuple(x or "" for x in kv[0]))]
+
+
+@app.get("/registrations")
+def list_registrations(
+    tournament_id: Optional[str] = Query(None, description="Tournament UUID"),
+    event: Optional[str] = Query(None, description="Filter by event name"),
+    standard: Optional[str] = Query(None, description="Filter by standard (e.g. Intermediate, Advanced)"),
+    age_group: Optional[str] = Query(None, description="Filter by age group (U11, U13, U15, U17, U19, Senior)"),
+    group_id: Optional[str] = Query(None, description="Filter by round-robin group UUID, or 'none' for unassigned"),
+    q: Optional[str] = Query(None, description="Search name or email (case-insensitive substring)"),
+    fields: Optional[str] = Query(None, description="Comma-separated columns to return (id and created_at always included)"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    include_counts: bool = Query(True, description="Include per-division counts"),
+) -> dict[str, Any]:
+    """List registrations for the admin console, newest first, with keyset pagination. Returns per-division (tournament + event + standard + age group) counts for the same filters."""
+    if not supabase:
+        raise HTTPException(status_code=503, detail="Supabase not configured")
+
+    if fields:
+        cols = [c.strip() for c in fields.split(",") if c.strip()]
+        unknown = [c for c in cols if c not in REGISTRATION_COLUMNS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+        cols = ["id", "created_at"] + [c for c in cols if c not in ("id", "created_at")]
+    else:
+        cols = list(REGISTRATION_COLUMNS)
+    term = (q or "").translate(_SEARCH_STRIP).strip()
+    search = _like_escape(term) if term else None  # LIKE-escaped; used by both the list and the counts
+
+    query = _filter_registrations(supabase.table("registrations").select(", ".join(cols)), tournament_id, event, standard, age_group, group_id, search)
+    if cursor:
+        after_created, after_id = _decode_cursor(cursor)
+        query = query.or_(f'created_at.lt."{after_created}",and(created_at.eq."{after_created}",id.lt.{after_id})')
+    # Fetch one extra row to know whether there is a next page
+    r = query.order("created_at", desc=True).order("id", desc=True).limit(limit + 1).execute()
+    rows = r.data or []
+    next_cursor = _encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    rows = rows[:limit]
+
+    # Resolve linked partner names for this page only
+    if "partner_id" in cols:
+        partner_ids = {str(row["partner_id"]) for row in rows if row.get("partner_id")}
+        names: dict[str, str] = {}
+        if partner_ids:
+            regs = supabase.table("registrations").select("id, full_name").in_("id", list(partner_ids)).execute()
+            names = {str(p["id"]): p.get("full_name") or "?" for p in regs.data or []}
+        for row in rows:
+            row["partner_full_name"] = names.get(str(row.get("partner_id") or "")) if row.get("partner_id") else None
+
+    result: dict[str, Any] = {"registrations": rows, "next_cursor": next_cursor}
+    if include_counts:
+        counts = _registration_division_counts(tournament_id, event, standard, age_group, group_id, search)
+        result["counts"] = counts
+        result["total"] = sum(c["count"] for c in counts)
+    return result
+
 
 @app.patch("/registrations/{registration_id}")
 def update_registration(registration_id: str, body: UpdateRegistrationBody) -> dict[str, Any]:
@@ -288,6 +448,9 @@ def update_registration(registration_id: str, body: UpdateRegistrationBody) -> d
     if not payload:
         return {"message": "No changes", "id": registration_id}
 
+    if payload.get("partner_id") == registration_id:
+        raise HTTPException(status_code=400, detail="A registration cannot be its own partner")
+
     # If changing partner_id, clear old partner's link and set new partner's link
     if "partner_id" in payload:
         old = supabase.table("registrations").select("partner_id").eq("id", registration_id).execute()
@@ -0,0 +1,56 @@
+-- Admin registrations list (GET /registrations): server-side filter, search and keyset pagination
+create extension if not exists pg_trgm;
+
+-- Keyset pagination orders by created_at, so every row needs one
+update public.registrations set created_at = now() where created_at is null;
+alter table public.registrations alter column created_at set not null;
+
+-- Division filter + keyset order (created_at desc, id desc)
+create index if not exists idx_registrations_division_created
+  on public.registrations (tournament_id, event, standard, age_group, created_at desc, id desc);
+
+create index if not exists idx_registrations_tournament_created
+  on public.registrations (tournament_id, created_at desc, id desc);
+
+create index if not exists idx_registrations_group_id on public.registrations (group_id);
+
+-- Trigram indexes so name/email ILIKE '%term%' search doesn't scan the table
+create index if not exists idx_registrations_full_name_trgm
+  on public.registrations using gin (full_name gin_trgm_ops);
+
+create index if not exists idx_registrations_email_trgm
+  on public.registrations using gin (email gin_trgm_ops);
+
+-- Per-division counts (tournament + event + standard + age_group), same filters as the list endpoint.
+-- p_search is LIKE-escaped by the API (\%, \_, \\) so it matches literally, same as the list.
+create or replace function public.registration_division_counts(
+  p_tournament_id uuid default null,
+  p_event text default null,
+  p_standard text default null,
+  p_age_group text default null,
+  p_group_id uuid default null,
+  p_unassigned boolean default false,
+  p_search text default null
+)
+returns table (tournament_id uuid, event text, standard text, age_group text, count bigint)
+language sql
+stable
+as $$
+  select r.tournament_id, r.event, r.standard, r.age_group, count(*)::bigint
+  from public.registrations r
+  where (p_tournament_id is null or r.tournament_id = p_tournament_id)
+    and (p_event is null or r.event = p_event)
+    and (p_standard is null or r.standard = p_standard)
+    and (p_age_group is null or r.age_group = p_age_group)
+    and (p_group_id is null or r.group_id = p_group_id)
+    and (not p_unassigned or r.group_id is null)
+    and (
+      p_search is null
+      or r.full_name ilike '%' || p_search || '%' escape '\'
+      or r.email ilike '%' || p_search || '%' escape '\'
+    )
+  group by r.tournament_id, r.event, r.standard, r.age_group
+  order by r.tournament_id, r.event, r.standard, r.age_group;
+$$;
+
+comment on function public.registration_division_counts is 'Registration counts per tournament + event + standard + age group. Used by GET /registrations so the admin console does not fetch every row to count.';
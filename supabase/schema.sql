@@ -50,7 +50,7 @@ create table if not exists public.registrations (
   standard text,
   notes text,
   group_id uuid references public.groups(id) on delete set null,
-  created_at timestamptz default now(),
+  created_at timestamptz not null default now(),
   unique(tournament_id, email, event)
 );
 
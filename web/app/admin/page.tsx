@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { useRouter } from "next/navigation";
 import { supabase } from "@/lib/supabase";
 import {
@@ -10,12 +10,16 @@ import {
   createGroup,
   deleteGroup,
   generateRoundRobin,
+  listRegistrations,
+  listAllRegistrations,
   updateRegistration,
   deleteRegistration,
   updateMatch,
   deleteMatch,
   type RegistrationUpdate,
   type MatchUpdate,
+  type RegistrationListItem,
+  type DivisionCount,
 } from "@/lib/api";
 import type { Group, Registration, Tournament } from "@/lib/supabase";
 import type { Match } from "@/lib/supabase";
@@ -30,10 +34,46 @@ const EVENTS = [
 const STANDARDS = ["Recreational", "Intermediate", "Advanced"];
 const AGE_GROUPS = ["U11", "U13", "U15", "U17", "U19", "Senior"];
 const MATCH_STATUSES = ["scheduled", "in_progress", "completed"];
+const REGISTRATIONS_PAGE_SIZE = 50;
+
+// List rows are projected (Partial); the edit modal needs a full registration, so check required fields are present
+function toEditableRegistration(r: RegistrationListItem): Registration | null {
+  if (r.tournament_id === undefined || r.full_name === undefined || r.email === undefined || r.age_group === undefined || r.event === undefined) {
+    return null;
+  }
+  return {
+    id: r.id,
+    tournament_id: r.tournament_id,
+    full_name: r.full_name,
+    email: r.email,
+    phone: r.phone ?? null,
+    age_group: r.age_group,
+    event: r.event,
+    partner_name: r.partner_name ?? null,
+    partner_id: r.partner_id ?? null,
+    standard: r.standard ?? null,
+    notes: r.notes ?? null,
+    group_id: r.group_id ?? null,
+    created_at: r.created_at,
+  };
+}
 
 export default function AdminPage() {
   const router = useRouter();
-  const [registrations, setRegistrations] = useState<Registration[]>([]);
+  const [registrations, setRegistrations] = useState<RegistrationListItem[]>([]);
+  const [regNextCursor, setRegNextCursor] = useState<string | null>(null);
+  const [regCursorFilters, setRegCursorFilters] = useState({ tournamentId: "", search: "" }); // filters the current cursor was issued for
+  const regRequestRef = useRef(0);
+  const [regTotal, setRegTotal] = useState(0);
+  const [regCounts, setRegCounts] = useState<DivisionCount[]>([]);
+  const [regSearch, setRegSearch] = useState("");
+  const [regTournamentId, setRegTournamentId] = useState("");
+  const [regLoadingMore, setRegLoadingMore] = useState(false);
+  const [regError, setRegError] = useState<string | null>(null);
+  const [rrRegistrations, setRrRegistrations] = useState<RegistrationListItem[]>([]);
+  const rrRequestRef = useRef(0);
+  const [partnerOptions, setPartnerOptions] = useState<RegistrationListItem[]>([]);
+  const partnerRequestRef = useRef(0);
   const [tournaments, setTournaments] = useState<Tournament[]>([]);
   const [loading, setLoading] = useState(true);
   const [drawTournamentId, setDrawTournamentId] = useState("");
@@ -82,20 +122,59 @@ export default function AdminPage() {
     router.refresh();
   }
 
+  // Each refresh bumps regRequestRef; responses (including load-more pages) for an older request are dropped
   function refreshRegistrations() {
-    supabase.from("registrations").select("*").order("created_at", { ascending: false }).then(({ data }) => {
-      if (!data) return;
-      setRegistrations(data);
-    });
+    const requestId = ++regRequestRef.current;
+    const search = regSearch.trim();
+    const tournamentId = regTournamentId;
+    setRegError(null);
+    listRegistrations({ tournamentId: tournamentId || undefined, q: search || undefined, limit: REGISTRATIONS_PAGE_SIZE })
+      .then((d) => {
+        if (requestId !== regRequestRef.current) return;
+        setRegistrations(d.registrations);
+        setRegNextCursor(d.next_cursor);
+        setRegCursorFilters({ tournamentId, search });
+        setRegTotal(d.total ?? d.registrations.length);
+        setRegCounts(d.counts ?? []);
+      })
+      .catch((e) => {
+        if (requestId !== regRequestRef.current) return;
+        setRegError(e instanceof Error ? e.message : "Failed to load registrations.");
+      });
   }
 
+  async function handleLoadMoreRegistrations() {
+    if (!regNextCursor) return;
+    const requestId = regRequestRef.current;
+    setRegLoadingMore(true);
+    try {
+      const d = await listRegistrations({
+        tournamentId: regCursorFilters.tournamentId || undefined,
+        q: regCursorFilters.search || undefined,
+        limit: REGISTRATIONS_PAGE_SIZE,
+        cursor: regNextCursor,
+        includeCounts: false,
+      });
+      if (requestId !== regRequestRef.current) return;
+      setRegistrations((prev) => [...prev, ...d.registrations]);
+      setRegNextCursor(d.next_cursor);
+    } catch (e) {
+      if (requestId !== regRequestRef.current) return;
+      setRegError(e instanceof Error ? e.message : "Failed to load registrations.");
+    } finally {
+      setRegLoadingMore(false);
+    }
+  }
+
+  // Registrations table: first page + per-division counts, re-fetched (debounced) when the tournament or search changes
+  useEffect(() => {
+    const t = setTimeout(refreshRegistrations, 300);
+    return () => clearTimeout(t);
+  }, [regSearch, regTournamentId]);
+
   useEffect(() => {
     (async () => {
-      const [r, t] = await Promise.all([
-        supabase.from("registrations").select("*").order("created_at", { ascending: false }),
-        supabase.from("tournaments").select("*"),
-      ]);
-      if (!r.error) setRegistrations(r.data ?? []);
+      const t = await supabase.from("tournaments").select("*");
       if (!t.error) {
         const data = t.data ?? [];
         setTournaments(data);
@@ -115,6 +194,51 @@ export default function AdminPage() {
       .finally(() => setRrGroupsLoading(false));
   }, [drawTournamentId, drawEvent, drawStandard, drawAgeGroup]);
 
+  // Players in the selected division for group assignment; responses for an older selection are dropped
+  function refreshRrRegistrations() {
+    const requestId = ++rrRequestRef.current;
+    if (!drawTournamentId || !drawEvent || !drawStandard || !drawAgeGroup) {
+      setRrRegistrations([]);
+      return;
+    }
+    listAllRegistrations({
+      tournamentId: drawTournamentId,
+      event: drawEvent,
+      standard: drawStandard,
+      ageGroup: drawAgeGroup,
+      fields: ["full_name", "group_id"],
+    })
+      .then((rows) => {
+        if (requestId === rrRequestRef.current) setRrRegistrations(rows);
+      })
+      .catch(() => {
+        if (requestId === rrRequestRef.current) setRrRegistrations([]);
+      });
+  }
+
+  useEffect(() => {
+    refreshRrRegistrations();
+  }, [drawTournamentId, drawEvent, drawStandard, drawAgeGroup]);
+
+  // Partner link options for the edit modal: same tournament + event only. Cleared on every change (and when the
+  // modal closes); responses for an older registration or event are dropped
+  useEffect(() => {
+    const requestId = ++partnerRequestRef.current;
+    setPartnerOptions([]);
+    if (!editingRegistration) return;
+    listAllRegistrations({
+      tournamentId: editingRegistration.tournament_id,
+      event: editingRegistration.event,
+      fields: ["full_name", "email"],
+    })
+      .then((rows) => {
+        if (requestId === partnerRequestRef.current) setPartnerOptions(rows.filter((r) => r.id !== editingRegistration.id));
+      })
+      .catch(() => {
+        if (requestId === partnerRequestRef.current) setPartnerOptions([]);
+      });
+  }, [editingRegistration?.id, editingRegistration?.tournament_id, editingRegistration?.event]);
+
   async function handleGenerateDraw() {
     if (!drawTournamentId || !drawEvent || !drawStandard || !drawAgeGroup) return;
     setDrawMessage(null);
@@ -157,6 +281,7 @@ export default function AdminPage() {
     setAssigningGroupRegId(regId);
     try {
       await updateRegistration(regId, { group_id: groupId });
+      setRrRegistrations((prev) => prev.map((r) => (r.id === regId ? { ...r, group_id: groupId } : r)));
       setRegistrations((prev) => prev.map((r) => (r.id === regId ? { ...r, group_id: groupId } : r)));
     } finally {
       setAssigningGroupRegId(null);
@@ -167,6 +292,7 @@ export default function AdminPage() {
     try {
       await deleteGroup(groupId);
       setRrGroups((prev) => prev.filter((g) => g.id !== groupId));
+      setRrRegistrations((prev) => prev.map((r) => (r.group_id === groupId ? { ...r, group_id: null } : r)));
       setRegistrations((prev) => prev.map((r) => (r.group_id === groupId ? { ...r, group_id: null } : r)));
     } catch (e) {
       setRrMessage({ ok: false, text: e instanceof Error ? e.message : "Failed to delete group." });
@@ -192,9 +318,14 @@ export default function AdminPage() {
     }
   }
 
-  const rrRegistrations = registrations.filter(
-    (r) => r.tournament_id === drawTournamentId && r.event === drawEvent && r.standard === drawStandard && r.age_group === drawAgeGroup
-  );
+  function handleEditRegistration(r: RegistrationListItem) {
+    const reg = toEditableRegistration(r);
+    if (!reg) {
+      setRegError("This row is missing fields needed for editing. Reload the list and try again.");
+      return;
+    }
+    setEditingRegistration(reg);
+  }
 
   async function handleSaveRegistration() {
     if (!editingRegistration) return;
@@ -215,6 +346,7 @@ export default function AdminPage() {
       await updateRegistration(editingRegistration.id, data);
       setEditingRegistration(null);
       refreshRegistrations();
+      refreshRrRegistrations();
     } catch (e) {
       setEditRegError(e instanceof Error ? e.message : "Failed to save");
     } finally {
@@ -228,6 +360,7 @@ export default function AdminPage() {
     try {
       await deleteRegistration(id);
       refreshRegistrations();
+      refreshRrRegistrations();
     } finally {
       setDeletingRegId(null);
     }
@@ -464,8 +597,38 @@ export default function AdminPage() {
       </section>
 
       <section className="mt-10">
-        <h2 className="text-lg font-semibold text-gray-900">Registrations ({registrations.length})</h2>
+        <h2 className="text-lg font-semibold text-gray-900">Registrations ({regTotal})</h2>
         <p className="mt-1 text-sm text-gray-600">Edit player info (e.g. standard: Recreational / Intermediate / Advanced) or delete a player. Changes apply to this registration only.</p>
+        <div className="mt-4 flex flex-wrap items-end gap-3">
+          <div>
+            <label className="mb-1 block text-sm font-medium text-gray-700">Tournament</label>
+            <select value={regTournamentId} onChange={(e) => setRegTournamentId(e.target.value)} className="min-w-[220px]">
+              <option value="">All</option>
+              {tournaments.map((t) => <option key={t.id} value={t.id}>{t.name}</option>)}
+            </select>
+          </div>
+          <div>
+            <label className="mb-1 block text-sm font-medium text-gray-700">Search</label>
+            <input
+              type="search"
+              placeholder="Name or email"
+              value={regSearch}
+              onChange={(e) => setRegSearch(e.target.value)}
+              className="min-w-[240px]"
+            />
+          </div>
+        </div>
+        {regCounts.length > 0 && (
+          <div className="mt-3 flex flex-wrap gap-2">
+            {regCounts.map((c) => (
+              <span key={`${c.tournament_id ?? ""}|${c.event}|${c.standard ?? ""}|${c.age_group}`} className="rounded-full bg-gray-100 px-2.5 py-1 text-xs font-medium text-gray-700">
+                {!regTournamentId && `${tournaments.find((t) => t.id === c.tournament_id)?.name ?? "No tournament"} · `}
+                {c.event} · {c.standard ?? "—"} · {c.age_group}: {c.count}
+              </span>
+            ))}
+          </div>
+        )}
+        {regError && <p className="mt-3 text-sm text-red-600">{regError}</p>}
         <div className="card mt-4 overflow-x-auto p-0">
           <table className="min-w-full divide-y divide-gray-200">
             <thead className="bg-gray-50">
@@ -482,8 +645,7 @@ export default function AdminPage() {
             </thead>
             <tbody className="divide-y divide-gray-200 bg-white">
               {registrations.map((r) => {
-                const partnerReg = r.partner_id ? registrations.find((x) => x.id === r.partner_id) : null;
-                const partnerDisplay = partnerReg ? partnerReg.full_name : (r.partner_name ?? "—");
+                const partnerDisplay = r.partner_full_name ?? r.partner_name ?? "—";
                 return (
                 <tr key={r.id} className="transition-colors hover:bg-gray-50">
                   <td className="whitespace-nowrap px-6 py-4 font-medium text-gray-900">{r.full_name}</td>
@@ -496,7 +658,7 @@ export default function AdminPage() {
                   <td className="whitespace-nowrap px-6 py-4 text-sm text-gray-600">{r.standard ?? "—"}</td>
                   <td className="whitespace-nowrap px-6 py-4 text-sm text-gray-500">{new Date(r.created_at).toLocaleDateString()}</td>
                   <td className="whitespace-nowrap px-6 py-4 text-right">
-                    <button type="button" onClick={() => setEditingRegistration({ ...r })} className="text-sm font-medium text-brand hover:text-brand-dark mr-3">Edit</button>
+                    <button type="button" onClick={() => handleEditRegistration(r)} className="text-sm font-medium text-brand hover:text-brand-dark mr-3">Edit</button>
                     <button type="button" onClick={() => handleDeleteRegistration(r.id)} disabled={deletingRegId === r.id} className="text-sm font-medium text-red-600 hover:text-red-800 disabled:opacity-50">Delete</button>
                   </td>
                 </tr>
@@ -505,6 +667,13 @@ export default function AdminPage() {
             </tbody>
           </table>
         </div>
+        {regNextCursor && (
+          <div className="mt-4 flex justify-center">
+            <button type="button" onClick={handleLoadMoreRegistrations} disabled={regLoadingMore} className="btn-secondary">
+              {regLoadingMore ? "Loading…" : `Load more (${registrations.length} of ${regTotal})`}
+            </button>
+          </div>
+        )}
       </section>
 
       {/* Edit registration modal */}
@@ -557,11 +726,9 @@ export default function AdminPage() {
                   className="w-full"
                 >
                   <option value="">No link</option>
-                  {registrations
-                    .filter((r) => r.tournament_id === editingRegistration.tournament_id && r.event === editingRegistration.event && r.id !== editingRegistration.id)
-                    .map((r) => (
-                      <option key={r.id} value={r.id}>{r.full_name} ({r.email})</option>
-                    ))}
+                  {partnerOptions.map((r) => (
+                    <option key={r.id} value={r.id}>{r.full_name} ({r.email})</option>
+                  ))}
                 </select>
                 <p className="mt-1 text-xs text-gray-500">For doubles/mixed: link to the other player&apos;s registration so they appear as a pair in the draw. Both must link to each other (saving sets it for both).</p>
               </div>
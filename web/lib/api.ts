@@ -125,7 +125,65 @@ export async function getDraws(
   return res.json();
 }
 
-// Admin-only: edit/delete registrations and matches (call from admin UI only)
+// Admin-only: list/edit/delete registrations and matches (call from admin UI only)
+export type RegistrationListItem = Partial<import("./supabase").Registration> & {
+  id: string;
+  created_at: string;
+  partner_full_name?: string | null;
+};
+
+export type DivisionCount = { tournament_id: string | null; event: string; standard: string | null; age_group: string; count: number };
+
+export type RegistrationListParams = {
+  tournamentId?: string;
+  event?: string;
+  standard?: string;
+  ageGroup?: string;
+  groupId?: string; // group UUID, or "none" for unassigned
+  q?: string;
+  fields?: string[];
+  limit?: number;
+  cursor?: string | null;
+  includeCounts?: boolean;
+};
+
+export async function listRegistrations(p: RegistrationListParams = {}): Promise<{
+  registrations: RegistrationListItem[];
+  next_cursor: string | null;
+  counts?: DivisionCount[];
+  total?: number;
+}> {
+  const params = new URLSearchParams();
+  if (p.tournamentId) params.set("tournament_id", p.tournamentId);
+  if (p.event) params.set("event", p.event);
+  if (p.standard) params.set("standard", p.standard);
+  if (p.ageGroup) params.set("age_group", p.ageGroup);
+  if (p.groupId) params.set("group_id", p.groupId);
+  if (p.q) params.set("q", p.q);
+  if (p.fields?.length) params.set("fields", p.fields.join(","));
+  if (p.limit) params.set("limit", String(p.limit));
+  if (p.cursor) params.set("cursor", p.cursor);
+  if (p.includeCounts === false) params.set("include_counts", "false");
+  const res = await fetchWithTimeout(`${API_URL}/registrations?${params}`);
+  if (!res.ok) {
+    const err = await res.json().catch(() => ({ detail: res.statusText }));
+    throw new Error(err.detail || "Failed to load registrations");
+  }
+  return res.json();
+}
+
+// Follows next_cursor until every matching registration is loaded (for lists that must be complete, e.g. group assignment)
+export async function listAllRegistrations(p: Omit<RegistrationListParams, "cursor" | "includeCounts"> = {}): Promise<RegistrationListItem[]> {
+  const all: RegistrationListItem[] = [];
+  let cursor: string | null = null;
+  do {
+    const page: Awaited<ReturnType<typeof listRegistrations>> = await listRegistrations({ limit: 200, ...p, cursor, includeCounts: false });
+    all.push(...page.registrations);
+    cursor = page.next_cursor;
+  } while (cursor);
+  return all;
+}
+
 export type RegistrationUpdate = {
   full_name?: string;
   email?: string;